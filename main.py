@@ -15,6 +15,15 @@ sys.path.insert(0, str(src_path))
 
 def main():
     """Launch the Textual chat client."""
+    # Use uvloop for the asyncio event loop when available (2-4x faster
+    # callback dispatch for the streaming/IO-heavy paths). Optional: falls
+    # back to the stdlib loop on Windows or when uvloop isn't installed.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         # Import and run the app
         from textual_ui.app import ClaudeChatApp
@@ -27,20 +27,20 @@ setup(
         "Topic :: Communications :: Chat",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
         "Operating System :: OS Independent",
         "Environment :: Console",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         "langchain-anthropic>=0.1.23",
         "langchain-core>=0.1.0",
         "anthropic>=0.30.0",
         "python-dotenv>=1.0.0",
+        "msgspec>=0.18.0",
+        "orjson>=3.9.0",
         "rich>=13.0.0",
         "textual>=5.2.0",
     ],
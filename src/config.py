@@ -1,8 +1,9 @@
 """Configuration management for the chat client."""
 
+import functools
 import os
 import logging
-from typing import Optional, Dict
+from typing import Any, Dict, Mapping, Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -12,51 +13,114 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+def _parse_env(env: Mapping[str, str]) -> Dict[str, Any]:
+    """Parse configuration settings from an environment mapping.
+
+    Kept as a pure function so the type conversions can be tested with a
+    crafted dict instead of reloading the whole module.
+    """
+    return {
+        # API Configuration
+        "ANTHROPIC_API_KEY": env.get("ANTHROPIC_API_KEY", ""),
+        # Model Configuration
+        "CLAUDE_MODEL": env.get("CLAUDE_MODEL", "claude-3-7-sonnet-latest"),
+        "MAX_TOKENS": int(env.get("MAX_TOKENS", "4000")),
+        "TEMPERATURE": float(env.get("TEMPERATURE", "0.7")),
+        # Thinking Mode Configuration
+        "THINKING_MODE": env.get("THINKING_MODE", "true").lower() == "true",
+        "THINKING_BUDGET_TOKENS": int(
+            env.get("THINKING_BUDGET_TOKENS", "2000")
+        ),
+        # Memory Management
+        "MAX_MEMORY_MESSAGES": int(env.get("MAX_MEMORY_MESSAGES", "50")),
+        "AUTO_SAVE_INTERVAL": int(env.get("AUTO_SAVE_INTERVAL", "300")),
+        # UI Configuration
+        "ENABLE_COLORS": env.get("ENABLE_COLORS", "true").lower() == "true",
+        "SHOW_TIMESTAMPS": (
+            env.get("SHOW_TIMESTAMPS", "true").lower() == "true"
+        ),
+        "SHOW_TOKEN_USAGE": (
+            env.get("SHOW_TOKEN_USAGE", "true").lower() == "true"
+        ),
+        # Logging Configuration
+        "LOG_LEVEL": env.get("LOG_LEVEL", "INFO"),
+        "LOG_FILE": env.get("LOG_FILE", "chat_client.log"),
+    }
+
+
+_ENV_SETTINGS = _parse_env(os.environ)
+
+
+def _is_valid_api_key(api_key: str) -> bool:
+    """Check that an API key is present and properly formatted."""
+    # Basic validation - should start with 'sk-ant-'
+    return bool(api_key and api_key.startswith("sk-ant-"))
+
+
+def _build_model_config(
+    model: str,
+    max_tokens: int,
+    temperature: float,
+    thinking_mode: bool,
+    thinking_budget_tokens: int,
+) -> dict:
+    """Build the client model-config dict from explicit settings.
+
+    Pure function of its arguments so the thinking-mode rules can be
+    exercised directly, without reading or mutating the shared Config
+    class state.
+    """
+    thinking = thinking_mode and "claude-3-7" in model
+
+    config = {
+        "model": model,
+        "max_tokens": max_tokens,
+        # For thinking mode, temperature must be 1.0
+        "temperature": 1.0 if thinking else temperature,
+    }
+
+    # Add thinking mode configuration if enabled
+    if thinking:
+        config["thinking"] = {
+            "type": "enabled",
+            "budget_tokens": thinking_budget_tokens,
+        }
+
+    return config
+
+
 class Config:
     """Configuration class for managing environment variables and settings."""
 
     # API Configuration
-    ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
+    ANTHROPIC_API_KEY: str = _ENV_SETTINGS["ANTHROPIC_API_KEY"]
 
     # Model Configuration
-    CLAUDE_MODEL: str = os.getenv("CLAUDE_MODEL", "claude-3-7-sonnet-latest")
-    MAX_TOKENS: int = int(os.getenv("MAX_TOKENS", "4000"))
-    TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.7"))
+    CLAUDE_MODEL: str = _ENV_SETTINGS["CLAUDE_MODEL"]
+    MAX_TOKENS: int = _ENV_SETTINGS["MAX_TOKENS"]
+    TEMPERATURE: float = _ENV_SETTINGS["TEMPERATURE"]
 
     # Thinking Mode Configuration
-    THINKING_MODE: bool = os.getenv("THINKING_MODE", "true").lower() == "true"
-    THINKING_BUDGET_TOKENS: int = int(
-        os.getenv("THINKING_BUDGET_TOKENS", "2000")
-    )
+    THINKING_MODE: bool = _ENV_SETTINGS["THINKING_MODE"]
+    THINKING_BUDGET_TOKENS: int = _ENV_SETTINGS["THINKING_BUDGET_TOKENS"]
 
     # Memory Management
-    MAX_MEMORY_MESSAGES: int = int(os.getenv("MAX_MEMORY_MESSAGES", "50"))
-    AUTO_SAVE_INTERVAL: int = int(os.getenv("AUTO_SAVE_INTERVAL", "300"))
+    MAX_MEMORY_MESSAGES: int = _ENV_SETTINGS["MAX_MEMORY_MESSAGES"]
+    AUTO_SAVE_INTERVAL: int = _ENV_SETTINGS["AUTO_SAVE_INTERVAL"]
 
     # UI Configuration
-    ENABLE_COLORS: bool = os.getenv("ENABLE_COLORS", "true").lower() == "true"
-    SHOW_TIMESTAMPS: bool = (
-        os.getenv("SHOW_TIMESTAMPS", "true").lower() == "true"
-    )
-    SHOW_TOKEN_USAGE: bool = (
-        os.getenv("SHOW_TOKEN_USAGE", "true").lower() == "true"
-    )
+    ENABLE_COLORS: bool = _ENV_SETTINGS["ENABLE_COLORS"]
+    SHOW_TIMESTAMPS: bool = _ENV_SETTINGS["SHOW_TIMESTAMPS"]
+    SHOW_TOKEN_USAGE: bool = _ENV_SETTINGS["SHOW_TOKEN_USAGE"]
 
     # Logging Configuration
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FILE: str = os.getenv("LOG_FILE", "chat_client.log")
+    LOG_LEVEL: str = _ENV_SETTINGS["LOG_LEVEL"]
+    LOG_FILE: str = _ENV_SETTINGS["LOG_FILE"]
 
     @classmethod
     def validate_api_key(cls) -> bool:
         """Validate that the API key is present and properly formatted."""
-        if not cls.ANTHROPIC_API_KEY:
-            return False
-
-        # Basic validation - should start with 'sk-ant-'
-        if not cls.ANTHROPIC_API_KEY.startswith("sk-ant-"):
-            return False
-
-        return True
+        return _is_valid_api_key(cls.ANTHROPIC_API_KEY)
 
     @classmethod
     def get_api_key_interactively(cls) -> Optional[str]:
@@ -81,28 +145,14 @@ class Config:
     @classmethod
     def get_model_config(cls) -> dict:
         """Get model configuration dictionary."""
-        # For thinking mode, temperature must be 1.0
-        temperature = (
-            1.0
-            if (cls.THINKING_MODE and "claude-3-7" in cls.CLAUDE_MODEL)
-            else cls.TEMPERATURE
+        return _build_model_config(
+            cls.CLAUDE_MODEL,
+            cls.MAX_TOKENS,
+            cls.TEMPERATURE,
+            cls.THINKING_MODE,
+            cls.THINKING_BUDGET_TOKENS,
         )
 
-        config = {
-            "model": cls.CLAUDE_MODEL,
-            "max_tokens": cls.MAX_TOKENS,
-            "temperature": temperature,
-        }
-
-        # Add thinking mode configuration if enabled
-        if cls.THINKING_MODE and "claude-3-7" in cls.CLAUDE_MODEL:
-            config["thinking"] = {
-                "type": "enabled",
-                "budget_tokens": cls.THINKING_BUDGET_TOKENS,
-            }
-
-        return config
-
     @classmethod
     def display_config(cls) -> None:
         """Display current configuration."""
@@ -126,8 +176,9 @@ class Config:
 
 
 # Dynamic model loading from Anthropic API
+@functools.lru_cache(maxsize=1)
 def _fetch_available_models() -> Dict[str, str]:
-    """Fetch available models from Anthropic API."""
+    """Fetch available models from Anthropic API (cached after first call)."""
     try:
         import anthropic
 
@@ -2,12 +2,24 @@
 
 import time
 from typing import List, Dict, Any, Optional, Iterator
-from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_core.callbacks import BaseCallbackHandler
 from config import Config
 import logging
 
+# langchain_anthropic (and the anthropic/httpx stack under it) is heavy
+# to import, so it is loaded on first client construction. The sentinel
+# keeps src.llm_handler.ChatAnthropic patchable in tests, which then
+# never pay the import at all.
+ChatAnthropic = None
+
+# Role -> message class dispatch for _prepare_messages; unknown roles
+# are dropped, matching the old if/elif behaviour
+_ROLE_TO_MSG = {
+    "user": HumanMessage,
+    "assistant": AIMessage,
+}
+
 
 class StreamingCallbackHandler(BaseCallbackHandler):
     """Callback handler for streaming responses."""
@@ -19,14 +31,17 @@ class StreamingCallbackHandler(BaseCallbackHandler):
         
     def on_llm_new_token(self, token: str, **kwargs) -> None:
         """Handle new token from LLM."""
-        # Check if this is thinking mode content
-        if token.startswith("<thinking>"):
-            self.is_thinking = True
-            return
-        elif token.endswith("</thinking>"):
-            self.is_thinking = False
-            return
-        
+        # Thinking tags can only appear in tokens containing "<", which
+        # almost no streamed text does, so one C-level containment scan
+        # skips both prefix/suffix checks on the hot path
+        if "<" in token:
+            if token.startswith("<thinking>"):
+                self.is_thinking = True
+                return
+            if token.endswith("</thinking>"):
+                self.is_thinking = False
+                return
+
         if self.is_thinking:
             self.thinking_tokens += 1
         else:
@@ -57,6 +72,11 @@ class LLMHandler:
     
     def _initialize_client(self) -> None:
         """Initialize the ChatAnthropic client."""
+        global ChatAnthropic
+        if ChatAnthropic is None:
+            from langchain_anthropic import ChatAnthropic as _ChatAnthropic
+            ChatAnthropic = _ChatAnthropic
+
         try:
             config = Config.get_model_config()
             
@@ -121,13 +141,12 @@ class LLMHandler:
         if self.system_prompt:
             langchain_messages.append(SystemMessage(content=self.system_prompt))
         
-        # Convert messages
+        # Convert messages via dict dispatch instead of an if/elif chain
         for msg in messages:
-            if msg["role"] == "user":
-                langchain_messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                langchain_messages.append(AIMessage(content=msg["content"]))
-        
+            message_cls = _ROLE_TO_MSG.get(msg["role"])
+            if message_cls is not None:
+                langchain_messages.append(message_cls(content=msg["content"]))
+
         return langchain_messages
     
     def generate_response(self, messages: List[Dict[str, str]], stream: bool = True, model: str = None) -> str:
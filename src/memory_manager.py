@@ -1,16 +1,61 @@
 """Memory Manager for in-memory conversation storage and management."""
 
+import functools
 import json
+import re
+import sys
 import time
 import uuid
+from bisect import bisect_left
+from collections import deque
+from itertools import islice
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timezone
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+import msgspec
 from config import Config
 import logging
 
+# Last-emitted timestamp cache: message bursts request the same
+# second's ISO string over and over, so isoformat runs at most once per
+# second instead of once per message
+_TS_CACHE = [0.0, ""]
 
-@dataclass
+
+def _now_iso() -> str:
+    """Current UTC time in ISO-8601, cached at one-second resolution."""
+    now = time.time()
+    if now - _TS_CACHE[0] < 1.0:
+        return _TS_CACHE[1]
+    stamp = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    _TS_CACHE[0] = now
+    _TS_CACHE[1] = stamp
+    return stamp
+
+
+@functools.lru_cache(maxsize=4096)
+def _estimate_tokens(content: str) -> int:
+    """Estimate token count for content (roughly 4 characters/token).
+
+    Memoized so repeated content — canned assistant phrasing, retried
+    sends — is measured once; the heuristic matches
+    LLMHandler.estimate_tokens.
+    """
+    return len(content) // 4
+
+
+def _keep_start_for_budget(cum_tokens: List[int], budget: int) -> int:
+    """Index of the first message in the longest suffix within budget.
+
+    The newest->oldest accumulate-until-budget walk reduces to one
+    bisect over the cumulative-token column: the suffix fits once its
+    prefix sum reaches total - budget. O(log N) for any history size,
+    with no warm-up or dispatch cost.
+    """
+    return bisect_left(cum_tokens, cum_tokens[-1] - budget)
+
+
+@dataclass(slots=True)
 class MessageData:
     """Data class for individual messages."""
     role: str
@@ -18,18 +63,25 @@ class MessageData:
     timestamp: str
     tokens: int = 0
     metadata: Optional[Dict[str, Any]] = None
-    
+
+    def __post_init__(self):
+        # Roles take a handful of values but deserialization produces a
+        # fresh string per message; interning collapses them to shared
+        # objects so role comparisons short-circuit on identity
+        self.role = sys.intern(self.role)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
-    
+        # msgspec walks the dataclass in C, much faster than asdict
+        return msgspec.to_builtins(self)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'MessageData':
         """Create from dictionary."""
-        return cls(**data)
+        return msgspec.convert(data, cls)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionMetadata:
     """Metadata for chat sessions."""
     session_id: str
@@ -41,68 +93,218 @@ class SessionMetadata:
     model_used: str
     is_active: bool = False
     summary: Optional[str] = None
-    
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
-    
+        return msgspec.to_builtins(self)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SessionMetadata':
         """Create from dictionary."""
-        return cls(**data)
+        return msgspec.convert(data, cls)
+
+
+class MessageView:
+    """Read-only dict-style view over a MessageData.
+
+    get_messages callers usually touch one or two keys per returned
+    mapping, so the view defers dict construction entirely: key access
+    is an attribute read on the underlying message, and nothing is
+    allocated per field until somebody actually asks for it.
+    """
+
+    __slots__ = ("_message",)
+
+    def __init__(self, message: MessageData):
+        self._message = message
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self._message, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self._message, key, default)
+
+    def __repr__(self) -> str:
+        return f"MessageView({self._message!r})"
+
+
+class _PinnedMessages:
+    """Bitmap-backed set of pinned message indices.
+
+    Bit i of the backing bytearray records whether message i is pinned,
+    so membership is a byte load and mask instead of a hash probe and
+    the whole structure costs one bit per message rather than a boxed
+    int per entry.
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, indices=()):
+        self._bits = bytearray()
+        for index in indices:
+            self.add(index)
+
+    def add(self, index: int) -> None:
+        byte = index >> 3
+        if byte >= len(self._bits):
+            self._bits.extend(b"\x00" * (byte + 1 - len(self._bits)))
+        self._bits[byte] |= 1 << (index & 7)
+
+    def discard(self, index: int) -> None:
+        byte = index >> 3
+        if byte < len(self._bits):
+            self._bits[byte] &= ~(1 << (index & 7)) & 0xFF
+
+    def clear(self) -> None:
+        self._bits.clear()
+
+    def __contains__(self, index: int) -> bool:
+        byte = index >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] & (1 << (index & 7)))
+
+    def __iter__(self):
+        for byte_index, byte in enumerate(self._bits):
+            base = byte_index << 3
+            while byte:
+                low_bit = byte & -byte
+                yield base + low_bit.bit_length() - 1
+                byte ^= low_bit
+
+    def __len__(self) -> int:
+        return sum(byte.bit_count() for byte in self._bits)
 
 
 class ConversationSession:
-    """Represents a single conversation session."""
-    
-    def __init__(self, session_id: str, name: str = None):
+    """Represents a single conversation session.
+
+    When max_messages is given the history is a fixed-capacity ring
+    buffer: the deque drops the oldest message on overflow at O(1) and
+    no explicit trimming is ever needed. Pinned-message indices are not
+    rewritten when old messages fall off the front.
+    """
+
+    def __init__(self, session_id: str, name: str = None, max_messages: Optional[int] = None):
         self.session_id = session_id
         self.name = name or f"Session {session_id[:8]}"
-        self.messages: List[MessageData] = []
+        self.messages: deque = deque(maxlen=max_messages)
+        # Cumulative token counts (len(messages) + 1 entries, starting
+        # at 0) so get_recent_context can bisect for its cutoff instead
+        # of re-summing from the tail on every call
+        self._cum_tokens: List[int] = [0]
         self.metadata = SessionMetadata(
             session_id=session_id,
             name=self.name,
-            created_at=datetime.now(timezone.utc).isoformat(),
-            last_updated=datetime.now(timezone.utc).isoformat(),
+            created_at=_now_iso(),
+            last_updated=_now_iso(),
             message_count=0,
             total_tokens=0,
             model_used=Config.CLAUDE_MODEL
         )
-        self.pinned_messages: List[int] = []  # Indices of pinned messages
+        self.pinned_messages = ()  # Indices of pinned messages (bitmap via setter)
+        # Lazy word -> message-index postings for search; extended on
+        # demand and rebuilt whenever the message list is replaced
+        self._search_index: Optional[Dict[str, List[int]]] = None
+        self._indexed_count = 0
+        # Cached get_summary result; None means stale and is reset by
+        # every mutation that the summary reflects
+        self._summary_cache: Optional[Dict[str, Any]] = None
         self.logger = logging.getLogger(__name__)
     
-    def add_message(self, role: str, content: str, tokens: int = 0, metadata: Dict[str, Any] = None) -> None:
-        """Add a message to the session."""
+    def add_message(self, role: str, content: str, tokens: Optional[int] = None, metadata: Dict[str, Any] = None) -> None:
+        """Add a message to the session, estimating tokens if not given."""
+        if tokens is None:
+            tokens = _estimate_tokens(content)
+
+        # At capacity the deque drops the oldest message on append;
+        # account for it before it goes. The prefix sums keep their
+        # base offset (the budgeting bisect only uses differences) and
+        # the search index is rebuilt lazily since indices shift.
+        max_len = self.messages.maxlen
+        if max_len is not None and len(self.messages) == max_len:
+            dropped = self.messages[0]
+            self.metadata.total_tokens -= dropped.tokens
+            del self._cum_tokens[0]
+            self._search_index = None
+            self._indexed_count = 0
+
         message = MessageData(
             role=role,
             content=content,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=_now_iso(),
             tokens=tokens,
-            metadata=metadata or {}
+            metadata=metadata  # stays None when unset; no dict allocated
         )
         
         self.messages.append(message)
+        self._cum_tokens.append(self._cum_tokens[-1] + tokens)
+        self._summary_cache = None
         self.metadata.message_count = len(self.messages)
         self.metadata.total_tokens += tokens
         self.metadata.last_updated = message.timestamp
         self.metadata.model_used = Config.CLAUDE_MODEL
         
         self.logger.debug(f"Added {role} message to session {self.session_id}")
-    
-    def get_messages(self, limit: Optional[int] = None, include_system: bool = True) -> List[Dict[str, str]]:
+
+    def extend_messages(self, messages: List[MessageData]) -> None:
+        """Append a batch of messages in one pass.
+
+        Import/restore paths use this instead of per-message add_message
+        calls so the counters and prefix sums update once per batch.
+        """
+        if not messages:
+            return
+
+        # Bounded sessions may drop from the front during the extend;
+        # rebuild the bookkeeping from whatever survived
+        if self.messages.maxlen is not None:
+            self.messages.extend(messages)
+            self._set_messages(self.messages)
+            self.metadata.message_count = len(self.messages)
+            self.metadata.total_tokens = self._cum_tokens[-1]
+            self.metadata.last_updated = messages[-1].timestamp
+            return
+
+        self.messages.extend(messages)
+        cum = self._cum_tokens
+        batch_start = cum[-1]
+        for msg in messages:
+            cum.append(cum[-1] + msg.tokens)
+
+        self._summary_cache = None
+        self.metadata.message_count = len(self.messages)
+        self.metadata.total_tokens += cum[-1] - batch_start
+        self.metadata.last_updated = messages[-1].timestamp
+
+        self.logger.debug(f"Added {len(messages)} messages to session {self.session_id}")
+
+    @property
+    def pinned_messages(self) -> _PinnedMessages:
+        return self._pinned
+
+    @pinned_messages.setter
+    def pinned_messages(self, indices) -> None:
+        """Rebuild the pin bitmap from an iterable of indices."""
+        self._pinned = _PinnedMessages(indices)
+
+    def get_messages(self, limit: Optional[int] = None, include_system: bool = True) -> List[MessageView]:
         """Get messages in format suitable for LLM."""
-        messages = []
-        
-        for i, msg in enumerate(self.messages):
-            if not include_system and msg.role == "system":
-                continue
-            
-            messages.append({
-                "role": msg.role,
-                "content": msg.content
-            })
-        
-        if limit:
+        source = self.messages
+
+        # With no role filtering the limit picks a plain tail, so slice
+        # before wrapping instead of covering the whole history
+        if limit and include_system:
+            source = islice(source, max(0, len(source) - limit), None)
+
+        messages = [
+            MessageView(msg)
+            for msg in source
+            if include_system or msg.role != "system"
+        ]
+
+        if limit and not include_system:
             return messages[-limit:]
         return messages
     
@@ -111,27 +313,72 @@ class ConversationSession:
         if not token_limit:
             token_limit = Config.MAX_TOKENS // 2  # Use half of max tokens for context
         
-        messages = []
-        current_tokens = 0
-        
-        # Start from the end and work backwards
-        for msg in reversed(self.messages):
-            if current_tokens + msg.tokens > token_limit:
-                break
-            
-            messages.insert(0, {
-                "role": msg.role,
-                "content": msg.content
-            })
-            current_tokens += msg.tokens
-        
-        return messages
+        cut = _keep_start_for_budget(self._cum_tokens, token_limit)
+
+        return [
+            {"role": msg.role, "content": msg.content}
+            for msg in islice(self.messages, cut, None)
+        ]
     
+    def _ensure_search_index(self) -> Dict[str, List[int]]:
+        """Build or extend the word -> message-index postings lazily."""
+        if self._search_index is None:
+            self._search_index = {}
+            self._indexed_count = 0
+
+        unindexed = islice(self.messages, self._indexed_count, None)
+        for i, msg in enumerate(unindexed, self._indexed_count):
+            for word in set(msg.content.lower().split()):
+                self._search_index.setdefault(word, []).append(i)
+        self._indexed_count = len(self.messages)
+        return self._search_index
+
+    def find_matching_messages(self, query_lower: str) -> List[int]:
+        """Return indices of messages whose content contains query_lower.
+
+        Single-word queries go through the inverted index: a substring
+        without whitespace always lies inside one whitespace-delimited
+        token, so scanning the (much smaller) vocabulary for matching
+        tokens yields exactly the matching messages. Queries containing
+        any whitespace (space, newline, tab, ...) can span token
+        boundaries and fall back to the linear scan.
+        """
+        if not query_lower or any(c.isspace() for c in query_lower):
+            # One compiled pattern searching the original content beats
+            # lowercasing (allocating) every message just to use `in`;
+            # the length check skips too-short messages before entering
+            # the regex engine at all
+            pattern = re.compile(re.escape(query_lower), re.IGNORECASE)
+            query_len = len(query_lower)
+            return [
+                i for i, msg in enumerate(self.messages)
+                if len(msg.content) >= query_len and pattern.search(msg.content)
+            ]
+
+        index = self._ensure_search_index()
+        candidates = set()
+        for word, postings in index.items():
+            if query_lower in word:
+                candidates.update(postings)
+        return sorted(candidates)
+
+    def _set_messages(self, messages: List[MessageData]) -> None:
+        """Replace message storage, rebuilding prefix sums and index state."""
+        self.messages = deque(messages, self.messages.maxlen)
+        cum = [0]
+        for msg in self.messages:
+            cum.append(cum[-1] + msg.tokens)
+        self._cum_tokens = cum
+        self._search_index = None
+        self._indexed_count = 0
+        self._summary_cache = None
+
     def pin_message(self, index: int) -> bool:
         """Pin a message to prevent it from being summarized."""
         if 0 <= index < len(self.messages):
             if index not in self.pinned_messages:
-                self.pinned_messages.append(index)
+                self.pinned_messages.add(index)
+                self._summary_cache = None
                 self.logger.info(f"Pinned message {index} in session {self.session_id}")
                 return True
         return False
@@ -139,7 +386,8 @@ class ConversationSession:
     def unpin_message(self, index: int) -> bool:
         """Unpin a message."""
         if index in self.pinned_messages:
-            self.pinned_messages.remove(index)
+            self.pinned_messages.discard(index)
+            self._summary_cache = None
             self.logger.info(f"Unpinned message {index} in session {self.session_id}")
             return True
         return False
@@ -148,46 +396,55 @@ class ConversationSession:
         """Clear all messages and return count of cleared messages."""
         count = len(self.messages)
         self.messages.clear()
+        self._cum_tokens = [0]
         self.pinned_messages.clear()
+        self._search_index = None
+        self._indexed_count = 0
+        self._summary_cache = None
         self.metadata.message_count = 0
         self.metadata.total_tokens = 0
-        self.metadata.last_updated = datetime.now(timezone.utc).isoformat()
+        self.metadata.last_updated = _now_iso()
         
         self.logger.info(f"Cleared {count} messages from session {self.session_id}")
         return count
     
     def get_summary(self) -> Dict[str, Any]:
         """Get session summary."""
-        if not self.messages:
-            return {
-                "session_id": self.session_id,
-                "name": self.name,
-                "message_count": 0,
-                "total_tokens": 0,
-                "last_activity": "Never",
-                "created": self.metadata.created_at,
-                "model": self.metadata.model_used
-            }
-        
-        last_message = self.messages[-1]
-        return {
-            "session_id": self.session_id,
-            "name": self.name,
-            "message_count": len(self.messages),
-            "total_tokens": self.metadata.total_tokens,
-            "last_activity": last_message.timestamp,
-            "last_message_preview": last_message.content[:100] + "..." if len(last_message.content) > 100 else last_message.content,
-            "created": self.metadata.created_at,
-            "model": self.metadata.model_used,
-            "pinned_count": len(self.pinned_messages)
-        }
+        if self._summary_cache is None:
+            if not self.messages:
+                self._summary_cache = {
+                    "session_id": self.session_id,
+                    "name": self.name,
+                    "message_count": 0,
+                    "total_tokens": 0,
+                    "last_activity": "Never",
+                    "created": self.metadata.created_at,
+                    "model": self.metadata.model_used
+                }
+            else:
+                last_message = self.messages[-1]
+                self._summary_cache = {
+                    "session_id": self.session_id,
+                    "name": self.name,
+                    "message_count": len(self.messages),
+                    "total_tokens": self.metadata.total_tokens,
+                    "last_activity": last_message.timestamp,
+                    "last_message_preview": last_message.content[:100] + "..." if len(last_message.content) > 100 else last_message.content,
+                    "created": self.metadata.created_at,
+                    "model": self.metadata.model_used,
+                    "pinned_count": len(self.pinned_messages)
+                }
+
+        # Shallow copy: callers annotate the result (list_sessions adds
+        # "is_active") and must not poison the cache
+        return dict(self._summary_cache)
     
     def export_data(self) -> Dict[str, Any]:
         """Export session data for persistence."""
         return {
             "metadata": self.metadata.to_dict(),
             "messages": [msg.to_dict() for msg in self.messages],
-            "pinned_messages": self.pinned_messages
+            "pinned_messages": list(self.pinned_messages)
         }
     
     @classmethod
@@ -195,8 +452,10 @@ class ConversationSession:
         """Create session from exported data."""
         metadata = SessionMetadata.from_dict(data["metadata"])
         session = cls(metadata.session_id, metadata.name)
+        session.extend_messages([MessageData.from_dict(msg) for msg in data["messages"]])
+        # Exported counters are authoritative; assign after the batch so
+        # extend_messages' bookkeeping doesn't win
         session.metadata = metadata
-        session.messages = [MessageData.from_dict(msg) for msg in data["messages"]]
         session.pinned_messages = data.get("pinned_messages", [])
         return session
 
@@ -211,10 +470,10 @@ class MemoryManager:
         self._auto_save_enabled = True
         self._last_auto_save = time.time()
     
-    def create_session(self, name: str = None, model: str = None) -> str:
+    def create_session(self, name: str = None, model: str = None, max_messages: Optional[int] = None) -> str:
         """Create a new conversation session with optional model specification."""
         session_id = str(uuid.uuid4())
-        session = ConversationSession(session_id, name)
+        session = ConversationSession(session_id, name, max_messages)
         
         # Set the model for this session
         if model:
@@ -301,12 +560,13 @@ class MemoryManager:
         
         if session:
             session.metadata.model_used = model
-            session.metadata.last_updated = datetime.now(timezone.utc).isoformat()
+            session.metadata.last_updated = _now_iso()
+            session._summary_cache = None
             self.logger.info(f"Updated model for session {session.session_id} to {model}")
             return True
         return False
     
-    def add_message(self, role: str, content: str, tokens: int = 0, metadata: Dict[str, Any] = None) -> bool:
+    def add_message(self, role: str, content: str, tokens: Optional[int] = None, metadata: Dict[str, Any] = None) -> bool:
         """Add a message to the current session."""
         session = self.get_current_session()
         if not session:
@@ -318,8 +578,12 @@ class MemoryManager:
         self._check_auto_save()
         return True
     
-    def get_conversation_history(self, limit: Optional[int] = None) -> List[Dict[str, str]]:
-        """Get conversation history from current session."""
+    def get_conversation_history(self, limit: Optional[int] = None) -> List[MessageView]:
+        """Get conversation history from current session.
+
+        Returns MessageView proxies, not dicts: subscripting and .get
+        work, but dict-only operations (.items(), ** unpacking) do not.
+        """
         session = self.get_current_session()
         if not session:
             return []
@@ -359,22 +623,33 @@ class MemoryManager:
             }
         
         # Keep recent messages and pinned messages
+        all_messages = list(session.messages)
         messages_to_keep = Config.MAX_MEMORY_MESSAGES // 2
-        recent_messages = session.messages[-messages_to_keep:]
-        
+        recent_messages = all_messages[-messages_to_keep:]
+
         # Collect pinned messages that aren't in recent messages
         pinned_messages = []
         for idx in session.pinned_messages:
-            if idx < len(session.messages) - messages_to_keep:
-                pinned_messages.append(session.messages[idx])
-        
-        # Create summary of old messages (simplified for now)
-        old_messages = session.messages[:-messages_to_keep]
-        old_messages = [msg for i, msg in enumerate(old_messages) if i not in session.pinned_messages]
+            if idx < len(all_messages) - messages_to_keep:
+                pinned_messages.append(all_messages[idx])
+
+        # Create summary of old messages (simplified for now), skipping
+        # pinned ones in the same pass instead of slicing then filtering
+        old_messages = [
+            msg for i, msg in enumerate(islice(all_messages, len(all_messages) - messages_to_keep))
+            if i not in session.pinned_messages
+        ]
         
         if old_messages:
             summary_content = f"[Previous conversation summary: {len(old_messages)} messages exchanged]"
-            summary_tokens = sum(msg.tokens for msg in old_messages)
+            # Range sum over the old messages from the prefix-sum column,
+            # minus the pinned ones being carried forward, instead of a
+            # Python loop over every dropped message. The column keeps a
+            # nonzero base on bounded sessions that have evicted entries,
+            # so subtract it rather than reading the absolute value.
+            cum = session._cum_tokens
+            old_total = cum[len(all_messages) - messages_to_keep] - cum[0]
+            summary_tokens = old_total - sum(msg.tokens for msg in pinned_messages)
             
             # Create new message list
             new_messages = []
@@ -397,12 +672,12 @@ class MemoryManager:
             
             # Update session
             old_count = len(session.messages)
-            session.messages = new_messages
+            session._set_messages(new_messages)
             session.metadata.message_count = len(new_messages)
-            session.metadata.total_tokens = sum(msg.tokens for msg in new_messages)
+            session.metadata.total_tokens = session._cum_tokens[-1]
             
             # Update pinned message indices
-            session.pinned_messages = []
+            session.pinned_messages = ()
             
             self.logger.info(f"Optimized session {target_session}: {old_count} -> {len(new_messages)} messages")
             
@@ -447,25 +722,32 @@ class MemoryManager:
     def search_messages(self, query: str, session_id: str = None) -> List[Dict[str, Any]]:
         """Search for messages containing the query."""
         results = []
+        query_lower = query.lower()
         sessions_to_search = [session_id] if session_id else list(self.sessions.keys())
-        
+
         for sid in sessions_to_search:
             if sid not in self.sessions:
                 continue
-                
+
             session = self.sessions[sid]
-            for i, message in enumerate(session.messages):
-                if query.lower() in message.content.lower():
-                    results.append({
-                        "session_id": sid,
-                        "session_name": session.name,
-                        "message_index": i,
-                        "role": message.role,
-                        "content": message.content,
-                        "timestamp": message.timestamp,
-                        "preview": self._get_message_preview(message.content, query)
-                    })
-        
+            matches = session.find_matching_messages(query_lower)
+            if not matches:
+                continue
+
+            # Materialize once: repeated deque indexing is linear
+            messages = list(session.messages)
+            for i in matches:
+                message = messages[i]
+                results.append({
+                    "session_id": sid,
+                    "session_name": session.name,
+                    "message_index": i,
+                    "role": message.role,
+                    "content": message.content,
+                    "timestamp": message.timestamp,
+                    "preview": self._get_message_preview(message.content, query)
+                })
+
         return results
     
     def _get_message_preview(self, content: str, query: str, context_chars: int = 100) -> str:
@@ -538,20 +820,12 @@ class MemoryManager:
             role_display = "🧑 **You**" if message.role == "user" else "🤖 **Claude**"
             timestamp = datetime.fromisoformat(message.timestamp.replace('Z', '+00:00')).strftime('%H:%M:%S')
             
-            lines.append(f"## {role_display} [{timestamp}]")
-            lines.append("")
-            
-            if message.role == "system":
-                lines.append(f"*System: {message.content}*")
-            else:
-                lines.append(message.content)
-            
+            body = f"*System: {message.content}*" if message.role == "system" else message.content
+
+            lines.extend((f"## {role_display} [{timestamp}]", "", body))
             if i in session.pinned_messages:
                 lines.append("📌 *Pinned*")
-            
-            lines.append("")
-            lines.append("---")
-            lines.append("")
+            lines.extend(("", "---", ""))
         
         return {"content": "\n".join(lines), "format": "markdown"}
     
@@ -573,14 +847,9 @@ class MemoryManager:
             role_display = "You" if message.role == "user" else "Claude"
             timestamp = datetime.fromisoformat(message.timestamp.replace('Z', '+00:00')).strftime('%H:%M:%S')
             
-            lines.append(f"[{timestamp}] {role_display}:")
-            lines.append(message.content)
-            
+            lines.extend((f"[{timestamp}] {role_display}:", message.content))
             if i in session.pinned_messages:
                 lines.append("(Pinned)")
-            
-            lines.append("")
-            lines.append("-" * 40)
-            lines.append("")
+            lines.extend(("", "-" * 40, ""))
         
         return {"content": "\n".join(lines), "format": "text"}
\ No newline at end of file
@@ -10,10 +10,17 @@ from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime, timezone
 from dataclasses import dataclass, asdict
-from .memory_manager import MemoryManager, ConversationSession
+import msgspec
+import orjson
+from .memory_manager import MemoryManager, ConversationSession, MessageData
 from .config import Config
 import logging
 
+# Shared C-level JSON encoder/decoder for backup payloads. The on-disk
+# container stays JSON so existing backups load unchanged.
+_JSON_ENCODER = msgspec.json.Encoder()
+_JSON_DECODER = msgspec.json.Decoder()
+
 
 @dataclass
 class BackupMetadata:
@@ -194,26 +201,27 @@ class SessionPersistence:
     
     def _write_backup_file(self, backup_data: Dict[str, Any], backup_name: str) -> Path:
         """Write backup data to file."""
+        encoded = _JSON_ENCODER.encode(backup_data)
         if self.compression_enabled:
             backup_file = self.backup_dir / f"{backup_name}.backup.gz"
-            with gzip.open(backup_file, 'wt', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2)
+            with gzip.open(backup_file, 'wb') as f:
+                f.write(encoded)
         else:
             backup_file = self.backup_dir / f"{backup_name}.backup.json"
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2)
-        
+            with open(backup_file, 'wb') as f:
+                f.write(encoded)
+
         return backup_file
     
     def _read_backup_file(self, backup_path: Path) -> Dict[str, Any]:
         """Read backup data from file."""
         try:
             if backup_path.suffix == '.gz':
-                with gzip.open(backup_path, 'rt', encoding='utf-8') as f:
-                    backup_data = json.load(f)
+                with gzip.open(backup_path, 'rb') as f:
+                    backup_data = _JSON_DECODER.decode(f.read())
             else:
-                with open(backup_path, 'r', encoding='utf-8') as f:
-                    backup_data = json.load(f)
+                with open(backup_path, 'rb') as f:
+                    backup_data = _JSON_DECODER.decode(f.read())
             
             # Verify checksum if present
             if "metadata" in backup_data and "checksum" in backup_data["metadata"]:
@@ -342,12 +350,14 @@ class SessionImportExport:
                     }
                     for msg in session.messages
                 ],
-                "pinned_messages": session.pinned_messages
+                "pinned_messages": list(session.pinned_messages)
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
-            
+            # orjson serializes in C and emits UTF-8 directly, so the
+            # export stays human-readable but no longer CPU-bound
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+
             self.logger.info(f"Exported session '{session.name}' to {file_path}")
             return True
             
@@ -369,18 +379,18 @@ class SessionImportExport:
             # Create session
             session = ConversationSession(session_id, session_name)
             
-            # Import messages
-            for msg_data in import_data.get("messages", []):
-                session.add_message(
+            # Import messages in one batch, keeping exported timestamps
+            now_iso = datetime.now(timezone.utc).isoformat()
+            session.extend_messages([
+                MessageData(
                     role=msg_data["role"],
                     content=msg_data["content"],
+                    timestamp=msg_data.get("timestamp", now_iso),
                     tokens=msg_data.get("tokens", 0),
                     metadata=msg_data.get("metadata", {})
                 )
-                
-                # Set timestamp if available
-                if "timestamp" in msg_data and session.messages:
-                    session.messages[-1].timestamp = msg_data["timestamp"]
+                for msg_data in import_data.get("messages", [])
+            ])
             
             # Import pinned messages
             session.pinned_messages = import_data.get("pinned_messages", [])
@@ -531,7 +541,7 @@ class PersistentMemoryManager(MemoryManager):
             self.logger.error(f"Failed to load sessions from file: {e}")
             return False
     
-    def add_message(self, role: str, content: str, tokens: int = 0, metadata: Dict[str, Any] = None) -> bool:
+    def add_message(self, role: str, content: str, tokens: Optional[int] = None, metadata: Dict[str, Any] = None) -> bool:
         """Add message with automatic backup if enabled."""
         result = super().add_message(role, content, tokens, metadata)
         
@@ -11,8 +11,6 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from config import Config, update_model, toggle_thinking_mode
-
 
 class SetupScreen(Screen):
     """Initial setup screen for API key and model configuration."""
@@ -23,6 +21,7 @@ class SetupScreen(Screen):
         super().__init__(**kwargs)
         self.api_key = ""
         self.selected_model = ""
+        self._status_label = None
         
         # Available models from config (dynamically fetched)
         from config import get_available_models
@@ -89,6 +88,9 @@ class SetupScreen(Screen):
     
     def save_configuration(self) -> bool:
         """Save the configuration and validate inputs."""
+        # Deferred import keeps the config module off the startup path
+        from config import Config, update_model, toggle_thinking_mode
+
         # Get values from inputs
         api_key_input = self.query_one("#api-key-input", Input)
         model_select = self.query_one("#model-select", Select)
@@ -136,37 +138,24 @@ class SetupScreen(Screen):
     
     def _show_success(self, message: str) -> None:
         """Show success message."""
-        try:
-            # Remove any existing message
-            existing = self.query("#success-message")
-            if existing:
-                existing[0].remove()
-        except:
-            pass
-        
-        status_label = Static(message, id="success-message")
-        status_label.add_class("success-message")
-        
-        # Add success message
-        form = self.query_one("#setup-form")
-        form.mount(status_label)
-    
+        self._show_status(message, "success-message")
+
     def _show_error(self, message: str) -> None:
         """Show error message."""
-        try:
-            # Remove any existing message
-            existing = self.query("#error-message")
-            if existing:
-                existing[0].remove()
-        except:
-            pass
-        
-        error_label = Static(f"❌ {message}", id="error-message")
-        error_label.add_class("error-message")
-        
-        # Add error message
-        form = self.query_one("#setup-form")
-        form.mount(error_label)
+        self._show_status(f"❌ {message}", "error-message")
+
+    def _show_status(self, message: str, css_class: str) -> None:
+        """Update the shared status label, mounting it on first use.
+
+        Reusing one widget avoids a remount and layout recompute on every
+        repeated error or success message.
+        """
+        if self._status_label is None:
+            self._status_label = Static("", id="status-message")
+            self.query_one("#setup-form").mount(self._status_label)
+
+        self._status_label.update(message)
+        self._status_label.set_classes(css_class)
     
     def on_mount(self) -> None:
         """Called when screen is mounted."""
@@ -1,11 +1,16 @@
 """Color themes for the chat application."""
 
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Any
+
+# Themes are wrapped in MappingProxyType so callers can share them safely
+# without defensive copies.
 
 # Default dark theme (similar to the target screenshot)
-DARK_THEME = {
+DARK_THEME: Mapping[str, Any] = MappingProxyType({
     "name": "dark",
-    "colors": {
+    "colors": MappingProxyType({
         "primary": "#8B0000",          # Dark red (like target screenshot)
         "secondary": "#4A0000",        # Darker red
         "accent": "#FF6B6B",           # Light red accent
@@ -17,13 +22,13 @@ DARK_THEME = {
         "success": "#00FF00",          # Green for success
         "warning": "#FFA500",          # Orange for warnings
         "error": "#FF0000",            # Red for errors
-    }
-}
+    })
+})
 
 # Light theme alternative
-LIGHT_THEME = {
-    "name": "light", 
-    "colors": {
+LIGHT_THEME: Mapping[str, Any] = MappingProxyType({
+    "name": "light",
+    "colors": MappingProxyType({
         "primary": "#DC143C",          # Crimson
         "secondary": "#B22222",        # Fire brick
         "accent": "#FF69B4",           # Hot pink accent
@@ -35,13 +40,13 @@ LIGHT_THEME = {
         "success": "#008000",          # Green for success
         "warning": "#FF8C00",          # Dark orange for warnings
         "error": "#DC143C",            # Crimson for errors
-    }
-}
+    })
+})
 
 # High contrast theme
-HIGH_CONTRAST_THEME = {
+HIGH_CONTRAST_THEME: Mapping[str, Any] = MappingProxyType({
     "name": "high_contrast",
-    "colors": {
+    "colors": MappingProxyType({
         "primary": "#FFFFFF",          # White primary
         "secondary": "#000000",        # Black secondary
         "accent": "#FFFF00",           # Yellow accent
@@ -53,19 +58,20 @@ HIGH_CONTRAST_THEME = {
         "success": "#00FF00",          # Bright green
         "warning": "#FFFF00",          # Bright yellow
         "error": "#FF0000",            # Bright red
-    }
-}
+    })
+})
 
-AVAILABLE_THEMES: Dict[str, Dict[str, Any]] = {
+AVAILABLE_THEMES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
     "dark": DARK_THEME,
     "light": LIGHT_THEME,
     "high_contrast": HIGH_CONTRAST_THEME,
-}
+})
 
-def get_theme(theme_name: str = "dark") -> Dict[str, Any]:
+@lru_cache(maxsize=8)
+def get_theme(theme_name: str = "dark") -> Mapping[str, Any]:
     """Get a theme by name."""
     return AVAILABLE_THEMES.get(theme_name, DARK_THEME)
 
 def get_theme_names() -> list[str]:
     """Get list of available theme names."""
-    return list(AVAILABLE_THEMES.keys())
\ No newline at end of file
+    return list(AVAILABLE_THEMES.keys())
@@ -1,12 +1,11 @@
 """Chat messages display widget for the chat application."""
 
+import time
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from textual.containers import ScrollableContainer, Vertical
 from textual.widgets import Static, Markdown
 from textual.message import Message
-from rich.text import Text
-from rich.markdown import Markdown as RichMarkdown
 
 
 class MessageAdded(Message):
@@ -74,6 +73,7 @@ class ChatMessagesWidget(ScrollableContainer):
         self.max_messages = 1000  # Limit to prevent memory issues
         self.auto_scroll = True
         self.show_timestamps = True
+        self._last_scroll_time = 0.0
         
     def on_mount(self) -> None:
         """Called when widget is mounted."""
@@ -103,9 +103,13 @@ class ChatMessagesWidget(ScrollableContainer):
         # Mount the widget
         self.mount(message_widget)
         
-        # Auto-scroll to bottom if enabled
+        # Auto-scroll to bottom if enabled. During burst appends (e.g.
+        # token streaming) an animation per message would pile up timer
+        # callbacks, so only animate when the chat has been idle.
         if self.auto_scroll:
-            self.scroll_end(animate=True)
+            now = time.monotonic()
+            self.scroll_end(animate=now - self._last_scroll_time >= 0.1)
+            self._last_scroll_time = now
         
         # Cleanup old messages if we exceed limit
         if len(self.messages) > self.max_messages:
@@ -1,7 +1,9 @@
 """Sidebar widget for sessions, commands, and status information."""
 
+import sys
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional
 from textual.containers import Vertical, Horizontal
 from textual.widgets import Static, ListView, ListItem, Label, Button
 from textual.message import Message
@@ -46,6 +48,26 @@ class SwitchSessionRequested(Message):
         super().__init__()
 
 
+# Model families that support thinking mode, checked by id prefix
+_THINKING_MODEL_PREFIXES = frozenset({"claude-3-7"})
+
+# Connection-status icons; anything unlisted displays as disconnected
+_STATUS_ICONS = {"Connected": "🟢"}
+
+
+def _is_thinking_model(model_name: str) -> bool:
+    """Check whether a model id belongs to a thinking-capable family."""
+    return any(model_name.startswith(p) for p in _THINKING_MODEL_PREFIXES)
+
+
+def _shorten_model(model_name: str, max_len: int = 15) -> str:
+    """Shorten a model name for display, truncating if necessary."""
+    display = model_name.replace("claude-", "").replace("-20", " '")
+    if len(display) > max_len:
+        display = display[:max_len - 3] + "..."
+    return display
+
+
 class SessionItem(ListItem):
     """Individual session item in the sidebar."""
     
@@ -53,34 +75,89 @@ class SessionItem(ListItem):
                  last_activity: Optional[str] = None, is_active: bool = False, 
                  model_used: str = None, **kwargs):
         self.session_id = session_id
-        self.session_name = session_name
+        # Intern strings commonly shared across items (model ids and
+        # repeated titles) so N sessions share one allocation each
+        self.session_name = sys.intern(session_name)
         self.message_count = message_count
         self.last_activity = last_activity or datetime.now().strftime("%H:%M")
         self.is_active = is_active
-        self.model_used = model_used or "Unknown"
-        
-        # Create display text
-        display_text = self._create_display_text()
-        
-        super().__init__(Static(display_text), **kwargs)
-        
+        self.model_used = sys.intern(model_used or "Unknown")
+        # Model-derived display strings are computed once per model change
+        # rather than on every render
+        self._short_model = sys.intern(_shorten_model(self.model_used))
+        self._is_thinking_model = _is_thinking_model(self.model_used)
+        self._display_key = None
+        self._display_cache = ""
+        self._rendered_text = ""
+
+        # Defer building the display text until the item is actually
+        # shown; bulk restores create many items that start off-screen.
+        # Keep a direct handle on the child Static so updates skip the
+        # CSS query.
+        self._display_dirty = True
+        self._static_child = Static("")
+        super().__init__(self._static_child, **kwargs)
+
         if is_active:
             self.add_class("session-active")
+
+    def _is_in_viewport(self) -> bool:
+        """Check whether this item is currently visible in the list viewport."""
+        if not self.is_mounted:
+            return False
+        try:
+            return bool(self.region)
+        except Exception:
+            # If visibility can't be determined, refresh rather than skip
+            return True
+
+    def _refresh_display(self) -> None:
+        """Re-render the display text, deferring for off-viewport items."""
+        if not self._is_in_viewport():
+            self._display_dirty = True
+            return
+        new_text = self._create_display_text()
+        if new_text != self._rendered_text:
+            self._static_child.update(new_text)
+            self._rendered_text = new_text
+        self._display_dirty = False
+
+    def on_mount(self) -> None:
+        """Called when the item is mounted into the list."""
+        if self._display_dirty:
+            self._refresh_display()
+
+    def on_show(self) -> None:
+        """Called when the item scrolls into view."""
+        if self._display_dirty:
+            self._refresh_display()
     
     def _create_display_text(self) -> str:
-        """Create the display text for this session."""
+        """Create the display text for this session, memoized on its inputs."""
+        key = (self.session_name, self.message_count, self.is_active, self.model_used)
+        if key == self._display_key:
+            return self._display_cache
+
         status_indicator = "● " if self.is_active else "○ "
         name_truncated = self.session_name[:15] + "..." if len(self.session_name) > 18 else self.session_name
-        
-        # Shorten model name for display
-        model_display = self.model_used.replace("claude-", "").replace("-20", " '")
-        if len(model_display) > 15:
-            model_display = model_display[:12] + "..."
-        
-        thinking_indicator = " 🧠" if "claude-3-7" in self.model_used else ""
-        
-        return f"{status_indicator}{name_truncated}\n{self.message_count} msgs | {model_display}{thinking_indicator}"
+
+        model_display = self._short_model
+        thinking_indicator = " 🧠" if self._is_thinking_model else ""
+
+        self._display_key = key
+        self._display_cache = (
+            f"{status_indicator}{name_truncated}\n"
+            f"{self.message_count} msgs | {model_display}{thinking_indicator}"
+        )
+        return self._display_cache
     
+    def set_model(self, model_used: str):
+        """Update the model for this session and refresh derived strings."""
+        self.model_used = sys.intern(model_used or "Unknown")
+        self._short_model = sys.intern(_shorten_model(self.model_used))
+        self._is_thinking_model = _is_thinking_model(self.model_used)
+        self._refresh_display()
+
     def update_info(self, message_count: int, last_activity: Optional[str] = None, is_active: bool = None):
         """Update session information."""
         self.message_count = message_count
@@ -88,13 +165,10 @@ class SessionItem(ListItem):
             self.last_activity = last_activity
         if is_active is not None:
             self.is_active = is_active
-            if is_active:
-                self.add_class("session-active")
-            else:
-                self.remove_class("session-active")
-        
-        # Update display
-        self.query_one(Static).update(self._create_display_text())
+            self.set_class(is_active, "session-active")
+
+        # Update display (deferred while scrolled out of the viewport)
+        self._refresh_display()
 
 
 # Removed CommandItem - no longer needed
@@ -108,35 +182,25 @@ class StatusWidget(Static):
         self.current_model = "Unknown"
         self.thinking_mode = False
         self.token_count = 0
-        
+        self._last_state = None
+        self._last_text = None
+
         super().__init__(self._create_status_text(), **kwargs)
         self.add_class("status-widget")
     
     def _create_status_text(self) -> str:
         """Create the status display text."""
-        if self.connection_status == "Connected":
-            status_icon = "🟢"
-        elif self.connection_status == "NO MODELS":
-            status_icon = "🔴"
-        else:
-            status_icon = "🔴"
-            
-        thinking_icon = "🧠" if self.thinking_mode else ""
-        
+        status_icon = _STATUS_ICONS.get(self.connection_status, "🔴")
+
         if self.connection_status == "NO MODELS":
-            lines = [f"{status_icon} NO MODELS"]
-        else:
-            lines = [
-                f"{status_icon} {self.connection_status}",
-                f"Model: {self.current_model}",
-            ]
-            
-            if self.thinking_mode:
-                lines.append(f"{thinking_icon} Thinking Mode")
-            
-            if self.token_count > 0:
-                lines.append(f"Tokens: ~{self.token_count}")
-        
+            return f"{status_icon} NO MODELS"
+
+        lines = [
+            f"{status_icon} {self.connection_status}",
+            f"Model: {self.current_model}",
+            *(["🧠 Thinking Mode"] if self.thinking_mode else []),
+            *([f"Tokens: ~{self.token_count}"] if self.token_count > 0 else []),
+        ]
         return "\n".join(lines)
     
     def update_status(self, connection_status: Optional[str] = None, 
@@ -152,8 +216,19 @@ class StatusWidget(Static):
             self.thinking_mode = thinking_mode
         if token_count is not None:
             self.token_count = token_count
-        
-        self.update(self._create_status_text())
+
+        # Skip the re-render entirely when nothing changed (e.g. periodic
+        # status polls with identical values)
+        new_state = (self.connection_status, self.current_model,
+                     self.thinking_mode, self.token_count)
+        if new_state == self._last_state:
+            return
+        self._last_state = new_state
+
+        new_text = self._create_status_text()
+        if new_text != self._last_text:
+            self._last_text = new_text
+            self.update(new_text)
 
 
 class SidebarWidget(Vertical):
@@ -163,6 +238,17 @@ class SidebarWidget(Vertical):
         super().__init__(**kwargs)
         self.sessions: Dict[str, Dict[str, Any]] = {}
         self.current_session_id: Optional[str] = None
+        self._model_display_cache: Dict[str, str] = {}
+        # Direct id -> widget map plus display order, so lookups don't
+        # have to scan the ListView children
+        self._session_items: Dict[str, SessionItem] = {}
+        self._session_order: List[str] = []
+        # Child widget handles resolved once in on_mount
+        self._sessions_list: Optional[ListView] = None
+        self._status_widget: Optional[StatusWidget] = None
+        self._model_display: Optional[Static] = None
+        self._sessions_header: Optional[Static] = None
+        self._last_header_count = -1
     
     def compose(self):
         """Compose the sidebar layout."""
@@ -189,7 +275,13 @@ class SidebarWidget(Vertical):
     def on_mount(self) -> None:
         """Called when widget is mounted."""
         self.border_title = "Navigation"
-        
+
+        # Resolve child widgets once so later updates skip DOM queries
+        self._sessions_list = self.query_one("#sessions-list", ListView)
+        self._status_widget = self.query_one("#status-widget", StatusWidget)
+        self._model_display = self.query_one("#current-model-display", Static)
+        self._sessions_header = self.query(".sidebar-header").first()
+
         # Add initial session if none exist
         if not self.sessions:
             self.add_session("default", "Default Session", is_current=True)
@@ -224,31 +316,33 @@ class SidebarWidget(Vertical):
             is_current,
             model_used
         )
-        
-        sessions_list = self.query_one("#sessions-list", ListView)
+        self._session_items[session_id] = session_item
+        if session_id not in self._session_order:
+            self._session_order.append(session_id)
+
+        sessions_list = self._sessions_list or self.query_one("#sessions-list", ListView)
         sessions_list.append(session_item)
-        
+
         # Update sessions header
         self._update_sessions_header()
-    
+
     def remove_session(self, session_id: str):
         """Remove a session from the sidebar."""
         if session_id in self.sessions:
             del self.sessions[session_id]
-            
+
             # Remove from list view
-            sessions_list = self.query_one("#sessions-list", ListView)
-            for item in sessions_list.children:
-                if isinstance(item, SessionItem) and item.session_id == session_id:
-                    item.remove()
-                    break
-            
+            item = self._session_items.pop(session_id, None)
+            if item is not None:
+                item.remove()
+            if session_id in self._session_order:
+                self._session_order.remove(session_id)
+
             # If this was current session, select another
             if self.current_session_id == session_id:
-                if self.sessions:
-                    # Select first available session
-                    first_session_id = next(iter(self.sessions))
-                    self.set_current_session(first_session_id)
+                if self._session_order:
+                    # Select first remaining session
+                    self.set_current_session(self._session_order[0])
                 else:
                     self.current_session_id = None
             
@@ -256,25 +350,24 @@ class SidebarWidget(Vertical):
     
     def set_current_session(self, session_id: str):
         """Set the current active session."""
-        if session_id not in self.sessions:
+        if session_id not in self.sessions or session_id == self.current_session_id:
             return
-        
+
         # Update session data
         old_current = self.current_session_id
         self.current_session_id = session_id
-        
+
         for sid, session_data in self.sessions.items():
             session_data["is_current"] = (sid == session_id)
-        
-        # Update list items
-        sessions_list = self.query_one("#sessions-list", ListView)
-        for item in sessions_list.children:
-            if isinstance(item, SessionItem):
-                item.update_info(
-                    item.message_count,
-                    item.last_activity,
-                    item.session_id == session_id
-                )
+
+        # Only the two items whose active state changed need widget updates
+        old_item = self._session_items.get(old_current) if old_current else None
+        if old_item is not None:
+            old_item.update_info(old_item.message_count, old_item.last_activity, is_active=False)
+
+        new_item = self._session_items.get(session_id)
+        if new_item is not None:
+            new_item.update_info(new_item.message_count, new_item.last_activity, is_active=True)
     
     def update_session_info(self, session_id: str, message_count: int, 
                            last_activity: Optional[str] = None):
@@ -288,33 +381,37 @@ class SidebarWidget(Vertical):
             self.sessions[session_id]["last_activity"] = last_activity
         
         # Update list item
-        sessions_list = self.query_one("#sessions-list", ListView)
-        for item in sessions_list.children:
-            if isinstance(item, SessionItem) and item.session_id == session_id:
-                item.update_info(message_count, last_activity)
-                break
+        item = self._session_items.get(session_id)
+        if item is not None:
+            item.update_info(message_count, last_activity)
     
     def _update_sessions_header(self):
         """Update the sessions header with count."""
         count = len(self.sessions)
-        headers = self.query(".sidebar-header")
-        if headers:
+        if count == self._last_header_count:
+            return
+        sessions_header = self._sessions_header
+        if sessions_header is None:
+            headers = self.query(".sidebar-header")
+            if not headers:
+                return
             sessions_header = headers[0]  # First header is sessions
-            sessions_header.update(f"Sessions ({count})")
-    
+        sessions_header.update(f"Sessions ({count})")
+        self._last_header_count = count
+
     def update_status(self, **kwargs):
         """Update the status widget."""
-        status_widget = self.query_one("#status-widget", StatusWidget)
+        status_widget = self._status_widget or self.query_one("#status-widget", StatusWidget)
         status_widget.update_status(**kwargs)
     
     def update_current_model(self, model_name: str):
         """Update the current model display."""
         try:
-            model_display = self.query_one("#current-model-display", Static)
-            # Truncate long model names for display
-            display_name = model_name.replace("claude-", "").replace("-20", " '")
-            if len(display_name) > 25:
-                display_name = display_name[:22] + "..."
+            model_display = self._model_display or self.query_one("#current-model-display", Static)
+            display_name = self._model_display_cache.get(model_name)
+            if display_name is None:
+                display_name = _shorten_model(model_name, 25)
+                self._model_display_cache[model_name] = display_name
             model_display.update(f"Current: {display_name}")
         except Exception:
             # Widget might not be mounted yet
@@ -328,17 +425,22 @@ class SidebarWidget(Vertical):
         """Get information about a specific session."""
         return self.sessions.get(session_id)
     
-    def get_all_sessions(self) -> Dict[str, Dict[str, Any]]:
-        """Get all sessions information."""
-        return self.sessions.copy()
+    def get_all_sessions(self) -> Mapping[str, Dict[str, Any]]:
+        """Get a read-only view of all sessions information.
+
+        Mutations must go through add_session/remove_session.
+        """
+        return MappingProxyType(self.sessions)
     
     def clear_sessions(self) -> None:
         """Clear all sessions from the sidebar."""
         self.sessions.clear()
         self.current_session_id = None
-        
+        self._session_items.clear()
+        self._session_order.clear()
+
         # Clear the sessions list view
-        sessions_list = self.query_one("#sessions-list", ListView)
+        sessions_list = self._sessions_list or self.query_one("#sessions-list", ListView)
         sessions_list.clear()
         
         # Update header
@@ -359,17 +461,13 @@ class SidebarWidget(Vertical):
             self.post_message(ModelSelectionRequested())
         elif event.button.id == "switch-session-btn":
             # Get currently selected session for switching
-            sessions_list = self.query_one("#sessions-list", ListView)
-            if sessions_list.index is not None and sessions_list.index >= 0:
-                # Get the selected session item
-                selected_item = sessions_list.children[sessions_list.index]
-                if isinstance(selected_item, SessionItem):
-                    self.post_message(SwitchSessionRequested(selected_item.session_id))
+            sessions_list = self._sessions_list or self.query_one("#sessions-list", ListView)
+            selected = sessions_list.highlighted_child
+            if isinstance(selected, SessionItem):
+                self.post_message(SwitchSessionRequested(selected.session_id))
         elif event.button.id == "delete-session-btn":
             # Get currently selected session for deletion
-            sessions_list = self.query_one("#sessions-list", ListView)
-            if sessions_list.index is not None and sessions_list.index >= 0:
-                # Get the selected session item
-                selected_item = sessions_list.children[sessions_list.index]
-                if isinstance(selected_item, SessionItem):
-                    self.post_message(DeleteSessionRequested(selected_item.session_id))
\ No newline at end of file
+            sessions_list = self._sessions_list or self.query_one("#sessions-list", ListView)
+            selected = sessions_list.highlighted_child
+            if isinstance(selected, SessionItem):
+                self.post_message(DeleteSessionRequested(selected.session_id))
\ No newline at end of file
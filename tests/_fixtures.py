@@ -0,0 +1,181 @@
+"""Shared fixture definitions, star-imported by conftest.py only.
+
+Keeping the fixtures here and importing them from the single top-level
+conftest guarantees one instance per session-scoped fixture. Importing
+this module from individual test files would create a second instance
+per import and silently defeat the session scoping — don't do that.
+"""
+
+import pytest
+from types import MappingProxyType, SimpleNamespace
+
+from src.config import Config
+
+__all__ = [
+    "temp_directory",
+    "mock_llm_handler",
+    "test_config",
+    "sample_messages",
+    "sample_conversation_data",
+    "sample_prompt_templates",
+    "setup_test_environment",
+]
+
+
+@pytest.fixture(scope="module")
+def temp_directory(tmp_path_factory):
+    """Create a temporary directory shared by a test module.
+
+    tmp_path_factory reuses pytest's numbered temp-dir tree and prunes
+    old runs itself, so there is no per-test mkdtemp/rmtree churn.
+    """
+    return str(tmp_path_factory.mktemp("tests"))
+
+
+# Canned model info returned by the stub handler below
+_MODEL_INFO = {
+    "model": "claude-3-sonnet",
+    "thinking_mode": False,
+    "temperature": 0.7,
+    "max_tokens": 4000
+}
+
+
+@pytest.fixture(scope="session")
+def mock_llm_handler():
+    """Provide a stub LLM handler for tests.
+
+    A plain SimpleNamespace is an order of magnitude cheaper to build
+    than a Mock and covers these tests, which only read canned return
+    values and never inspect call records.
+    """
+    return SimpleNamespace(
+        current_model="claude-3-sonnet",
+        generate_response=lambda *args, **kwargs: "Mock response",
+        estimate_tokens=lambda *args, **kwargs: 50,
+        get_model_info=lambda: _MODEL_INFO,
+        test_connection=lambda: True,
+        switch_model=lambda *args, **kwargs: True,
+        set_system_prompt=lambda *args, **kwargs: None,
+        clear_system_prompt=lambda *args, **kwargs: None,
+    )
+
+
+@pytest.fixture
+def test_config():
+    """Configure test settings."""
+    # Store original values
+    original_max_messages = Config.MAX_MEMORY_MESSAGES
+    original_thinking_mode = Config.THINKING_MODE
+
+    # Set test values
+    Config.MAX_MEMORY_MESSAGES = 20  # Smaller for faster tests
+    Config.THINKING_MODE = False
+
+    yield Config
+
+    # Restore original values
+    Config.MAX_MEMORY_MESSAGES = original_max_messages
+    Config.THINKING_MODE = original_thinking_mode
+
+
+# Sample data is built exactly once at import and frozen; tests that
+# need a mutable copy should copy.deepcopy at the call site
+_SAMPLE_MESSAGES = tuple(MappingProxyType(m) for m in (
+    {"role": "user", "content": "Hello, how are you?"},
+    {"role": "assistant", "content": "I'm doing well, thank you! How can I help you today?"},
+    {"role": "user", "content": "I need help with Python programming."},
+    {"role": "assistant", "content": "I'd be happy to help with Python. What specific topic would you like to discuss?"},
+    {"role": "user", "content": "How do I create a function?"},
+    {"role": "assistant", "content": "You can create a function in Python using the 'def' keyword. Here's an example:\n\n```python\ndef my_function():\n    print('Hello, World!')\n```"}
+))
+
+_SAMPLE_CONVERSATION_DATA = MappingProxyType({
+    "session_id": "test-session-123",
+    "name": "Test Session",
+    "created_at": "2025-01-01T12:00:00Z",
+    "messages": (
+        MappingProxyType({
+            "role": "user",
+            "content": "Hello",
+            "timestamp": "2025-01-01T12:00:00Z",
+            "tokens": 5,
+            "metadata": {}
+        }),
+        MappingProxyType({
+            "role": "assistant",
+            "content": "Hello! How can I help you today?",
+            "timestamp": "2025-01-01T12:00:01Z",
+            "tokens": 10,
+            "metadata": {}
+        }),
+    ),
+    "pinned_messages": (),
+    "metadata": MappingProxyType({
+        "session_id": "test-session-123",
+        "name": "Test Session",
+        "created_at": "2025-01-01T12:00:00Z",
+        "last_updated": "2025-01-01T12:00:01Z",
+        "message_count": 2,
+        "total_tokens": 15,
+        "model_used": "claude-3-sonnet",
+        "is_active": True,
+        "summary": None
+    })
+})
+
+_SAMPLE_PROMPT_TEMPLATES = tuple(MappingProxyType(t) for t in (
+    {
+        "name": "coding-assistant",
+        "description": "Helps with programming tasks",
+        "system_prompt": "You are a {language} programming expert. Help users with {task_type} tasks.",
+        "variables": ["language", "task_type"],
+        "category": "development",
+        "author": "test",
+        "created_at": "2025-01-01T12:00:00Z",
+        "usage_count": 5
+    },
+    {
+        "name": "research-helper",
+        "description": "Assists with research and analysis",
+        "system_prompt": "You are a research assistant specializing in {domain}. Provide thorough analysis.",
+        "variables": ["domain"],
+        "category": "research",
+        "author": "test",
+        "created_at": "2025-01-01T12:00:00Z",
+        "usage_count": 3
+    }
+))
+
+
+@pytest.fixture(scope="session")
+def sample_messages():
+    """Provide sample messages for testing (shared; treat as read-only)."""
+    return _SAMPLE_MESSAGES
+
+
+@pytest.fixture(scope="session")
+def sample_conversation_data():
+    """Provide sample conversation data for testing (shared; treat as read-only)."""
+    return _SAMPLE_CONVERSATION_DATA
+
+
+@pytest.fixture(scope="session")
+def sample_prompt_templates():
+    """Provide sample prompt templates for testing (shared; treat as read-only)."""
+    return _SAMPLE_PROMPT_TEMPLATES
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment():
+    """Set up the test environment.
+
+    Session fixtures are lazily initialized, so without the eager
+    imports below the module-parse cost would stall whichever test
+    happens to touch these modules first.
+    """
+    import src.config  # noqa: F401
+    import src.llm_handler  # noqa: F401
+    import src.memory_manager  # noqa: F401
+    yield
+    # Cleanup after all tests
@@ -0,0 +1,107 @@
+"""Plain-function test helpers.
+
+Import these directly (``from tests._helpers import ...``) — module
+functions resolve via LOAD_GLOBAL, skipping the fixture hop and
+bound-method lookup the old TestHelpers class required.
+"""
+
+from typing import Any
+
+import msgspec
+
+
+class _SessionData(msgspec.Struct):
+    """Expected shape of a session summary dict."""
+
+    session_id: str
+    name: str
+    message_count: int
+    total_tokens: int
+    last_activity: Any
+
+
+class _SessionInfo(msgspec.Struct):
+    total_messages: int
+    user_messages: Any
+    assistant_messages: Any
+
+
+class _MemoryUsage(msgspec.Struct):
+    messages_in_memory: Any
+    memory_utilization: float
+
+
+class _AnalyticsData(msgspec.Struct):
+    """Expected shape of an analytics dict."""
+
+    session_info: _SessionInfo
+    topic_analysis: Any
+    message_patterns: Any
+    memory_usage: _MemoryUsage
+
+
+def create_test_messages(count: int, start_index: int = 0):
+    """Create test messages for testing."""
+    # Comprehension compiles to the specialized LIST_APPEND bytecode,
+    # faster than repeated list.append for large counts
+    return [
+        {
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": f"Test message {i}",
+            "timestamp": f"2025-01-01T12:{i:02d}:00Z",
+            "tokens": 10 + (i % 5),
+            "metadata": {"test_index": i}
+        }
+        for i in range(start_index, start_index + count)
+    ]
+
+
+def create_conversation_history(exchanges: int):
+    """Create a conversation history with specified number of exchanges."""
+    return [
+        message
+        for i in range(exchanges)
+        for message in (
+            {"role": "user", "content": f"User message {i}"},
+            {"role": "assistant", "content": f"Assistant response {i}"},
+        )
+    ]
+
+
+def assert_valid_session_data(session_data):
+    """Assert that session data has the expected structure.
+
+    Field presence and types are checked in one C-level msgspec
+    conversion rather than per-field Python asserts.
+    """
+    data = msgspec.convert(session_data, _SessionData)
+    assert data.message_count >= 0
+    assert data.total_tokens >= 0
+
+
+def assert_valid_command_result(result):
+    """Assert that a command result has the expected structure."""
+    assert isinstance(result, dict), "Command result should be a dictionary"
+
+    # Should have either success or error, not both
+    has_success = "success" in result
+    has_error = "error" in result
+    assert has_success != has_error, "Result should have either success or error, not both"
+
+    if has_success:
+        assert isinstance(result["success"], bool)
+        if result["success"] and "message" in result:
+            assert isinstance(result["message"], str)
+
+    if has_error:
+        assert isinstance(result["error"], str)
+        assert len(result["error"]) > 0
+
+
+def assert_valid_analytics_data(analytics):
+    """Assert that analytics data has the expected structure.
+
+    Sections and field types are checked in one C-level msgspec
+    conversion; msgspec accepts ints for the float utilization field.
+    """
+    msgspec.convert(analytics, _AnalyticsData)
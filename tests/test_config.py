@@ -3,13 +3,40 @@
 import pytest
 import os
 from unittest.mock import patch, mock_open
-import sys
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from src.config import (
+    Config,
+    _build_model_config,
+    _fetch_available_models,
+    _is_valid_api_key,
+    _parse_env,
+    update_model,
+    toggle_thinking_mode,
+    setup_config,
+    get_available_models,
+)
 
-from src.config import Config, update_model, toggle_thinking_mode, setup_config, get_available_models
+# Config attributes that tests are allowed to mutate
+_CONFIG_FIELDS = (
+    "CLAUDE_MODEL", "MAX_TOKENS", "TEMPERATURE", "THINKING_MODE",
+    "MAX_MEMORY_MESSAGES", "ANTHROPIC_API_KEY", "THINKING_BUDGET_TOKENS",
+    "AUTO_SAVE_INTERVAL",
+)
+
+
+@pytest.fixture(autouse=True)
+def _config_snapshot():
+    """Snapshot mutable Config attributes and restore them after each test.
+
+    Replaces the per-test original_* save/restore blocks, so tests can
+    mutate Config freely without leaking state into each other.
+    """
+    snapshot = {field: getattr(Config, field) for field in _CONFIG_FIELDS}
+    yield
+    for field, value in snapshot.items():
+        setattr(Config, field, value)
+    # Drop any model list cached during the test
+    _fetch_available_models.cache_clear()
 
 
 class TestConfig:
@@ -34,108 +61,84 @@ class TestConfig:
         
         assert src.config.Config.CLAUDE_MODEL == "claude-3-haiku-20240307"
     
-    def test_validate_api_key_valid(self):
-        """Test API key validation with valid key."""
-        original_key = Config.ANTHROPIC_API_KEY
-        
-        Config.ANTHROPIC_API_KEY = "sk-ant-REDACTED"
-        assert Config.validate_api_key() == True
-        
-        Config.ANTHROPIC_API_KEY = original_key
-    
-    def test_validate_api_key_invalid(self):
-        """Test API key validation with invalid key."""
-        original_key = Config.ANTHROPIC_API_KEY
-        
-        # Empty key
-        Config.ANTHROPIC_API_KEY = ""
-        assert Config.validate_api_key() == False
-        
-        # Wrong format
-        Config.ANTHROPIC_API_KEY = "invalid-key-format"
-        assert Config.validate_api_key() == False
-        
-        Config.ANTHROPIC_API_KEY = original_key
-    
+    @pytest.mark.parametrize("key,expected", [
+        ("sk-ant-REDACTED", True),
+        ("", False),            # empty key
+        ("invalid-key-format", False),  # wrong format
+    ])
+    def test_validate_api_key(self, key, expected):
+        """Test API key validation across key formats."""
+        # The pure helper takes the key directly, so no Config mutation
+        assert _is_valid_api_key(key) is expected
+
     @patch('builtins.input', return_value='sk-ant-api03-test-key')
     def test_get_api_key_interactively_valid(self, mock_input):
         """Test interactive API key input with valid key."""
-        original_key = Config.ANTHROPIC_API_KEY
         Config.ANTHROPIC_API_KEY = ""
-        
+
         result = Config.get_api_key_interactively()
-        
+
         assert result == 'sk-ant-api03-test-key'
         assert Config.ANTHROPIC_API_KEY == 'sk-ant-api03-test-key'
-        
-        Config.ANTHROPIC_API_KEY = original_key
-    
+
     @patch('builtins.input', return_value='invalid-key')
     def test_get_api_key_interactively_invalid(self, mock_input):
         """Test interactive API key input with invalid key."""
-        original_key = Config.ANTHROPIC_API_KEY
         Config.ANTHROPIC_API_KEY = ""
-        
+
         result = Config.get_api_key_interactively()
-        
+
         assert result is None
-        
-        Config.ANTHROPIC_API_KEY = original_key
     
     def test_get_model_config(self):
         """Test getting model configuration."""
-        config = Config.get_model_config()
-        
-        assert "model" in config
-        assert "max_tokens" in config
-        assert "temperature" in config
-        assert config["model"] == Config.CLAUDE_MODEL
-        assert config["max_tokens"] == Config.MAX_TOKENS
-        assert config["temperature"] == Config.TEMPERATURE
-    
+        config = _build_model_config(
+            model="claude-3-5-sonnet-20241022",
+            max_tokens=4000,
+            temperature=0.7,
+            thinking_mode=False,
+            thinking_budget_tokens=2000,
+        )
+
+        assert config["model"] == "claude-3-5-sonnet-20241022"
+        assert config["max_tokens"] == 4000
+        assert config["temperature"] == 0.7
+
     def test_get_model_config_with_thinking(self):
         """Test model configuration with thinking mode."""
-        original_thinking = Config.THINKING_MODE
-        original_model = Config.CLAUDE_MODEL
-        
-        Config.THINKING_MODE = True
-        Config.CLAUDE_MODEL = "claude-3-7-sonnet-latest"
-        
-        config = Config.get_model_config()
-        
-        assert "thinking" in config
+        config = _build_model_config(
+            model="claude-3-7-sonnet-latest",
+            max_tokens=4000,
+            temperature=0.7,
+            thinking_mode=True,
+            thinking_budget_tokens=2000,
+        )
+
         assert config["thinking"]["type"] == "enabled"
-        assert config["thinking"]["budget_tokens"] == Config.THINKING_BUDGET_TOKENS
-        
-        Config.THINKING_MODE = original_thinking
-        Config.CLAUDE_MODEL = original_model
-    
+        assert config["thinking"]["budget_tokens"] == 2000
+        # Thinking mode forces temperature to 1.0
+        assert config["temperature"] == 1.0
+
     def test_get_model_config_without_thinking(self):
         """Test model configuration without thinking mode."""
-        original_thinking = Config.THINKING_MODE
-        original_model = Config.CLAUDE_MODEL
-        
-        Config.THINKING_MODE = False
-        
-        config = Config.get_model_config()
-        
+        config = _build_model_config(
+            model="claude-3-7-sonnet-latest",
+            max_tokens=4000,
+            temperature=0.7,
+            thinking_mode=False,
+            thinking_budget_tokens=2000,
+        )
+
         assert "thinking" not in config
-        
-        Config.THINKING_MODE = original_thinking
-        Config.CLAUDE_MODEL = original_model
     
-    @patch('builtins.print')
-    def test_display_config(self, mock_print):
+    def test_display_config(self, capsys):
         """Test configuration display."""
         Config.display_config()
-        
-        # Verify print was called with configuration info
-        assert mock_print.called
-        
+
         # Check that model info was printed
-        printed_text = ' '.join([str(call.args[0]) for call in mock_print.call_args_list])
-        assert Config.CLAUDE_MODEL in printed_text
-        assert str(Config.MAX_TOKENS) in printed_text
+        captured = capsys.readouterr()
+        assert Config.CLAUDE_MODEL in captured.out
+        assert str(Config.MAX_TOKENS) in captured.out
 
 
 class TestAvailableModels:
@@ -196,8 +199,6 @@ class TestConfigFunctions:
     
     def test_toggle_thinking_mode(self):
         """Test toggling thinking mode."""
-        original_thinking = Config.THINKING_MODE
-        
         # Toggle from current state
         new_state = toggle_thinking_mode()
         # The toggle should change the state
@@ -209,22 +210,20 @@ class TestConfigFunctions:
         assert isinstance(restored_state, bool)
     
     @patch('src.config.Config.validate_api_key', return_value=True)
-    @patch('builtins.print')
-    def test_setup_config_valid_key(self, mock_print, mock_validate):
+    def test_setup_config_valid_key(self, mock_validate, capsys):
         """Test setup with valid API key."""
         result = setup_config()
-        
+
         assert result == True
         assert mock_validate.called
-        assert mock_print.called
-    
+        assert "validated" in capsys.readouterr().out
+
     @patch('src.config.Config.validate_api_key', return_value=False)
     @patch('src.config.Config.get_api_key_interactively', return_value='sk-ant-test-key')
-    @patch('builtins.print')
-    def test_setup_config_interactive_key(self, mock_print, mock_interactive, mock_validate):
+    def test_setup_config_interactive_key(self, mock_interactive, mock_validate):
         """Test setup with interactive API key entry."""
         result = setup_config()
-        
+
         assert result == True
         assert mock_validate.called
         assert mock_interactive.called
@@ -243,56 +242,39 @@ class TestConfigFunctions:
 class TestEnvironmentVariables:
     """Test environment variable handling."""
     
-    @patch.dict(os.environ, {
-        "MAX_TOKENS": "8000",
-        "TEMPERATURE": "0.5",
-        "THINKING_MODE": "false",
-        "MAX_MEMORY_MESSAGES": "100"
-    })
     def test_environment_variable_types(self):
         """Test that environment variables are converted to correct types."""
-        # Reload config to pick up environment changes
-        from importlib import reload
-        import src.config
-        reload(src.config)
-        
-        assert src.config.Config.MAX_TOKENS == 8000  # int
-        assert src.config.Config.TEMPERATURE == 0.5  # float  
-        assert src.config.Config.THINKING_MODE == False  # bool
-        assert src.config.Config.MAX_MEMORY_MESSAGES == 100  # int
-    
-    @patch.dict(os.environ, {"THINKING_MODE": "TRUE"})
-    def test_thinking_mode_case_insensitive(self):
-        """Test that thinking mode accepts case-insensitive boolean values."""
-        from importlib import reload
-        import src.config
-        reload(src.config)
-        
-        assert src.config.Config.THINKING_MODE == True
-    
-    @patch.dict(os.environ, {"THINKING_MODE": "yes"})
-    def test_thinking_mode_alternative_values(self):
-        """Test thinking mode with alternative boolean values."""
-        from importlib import reload
-        import src.config
-        reload(src.config)
-        
-        # Should default to True for unrecognized values that aren't "false"
-        assert src.config.Config.THINKING_MODE == False  # Only "true" should be True
-    
+        result = _parse_env({
+            "MAX_TOKENS": "8000",
+            "TEMPERATURE": "0.5",
+            "THINKING_MODE": "false",
+            "MAX_MEMORY_MESSAGES": "100"
+        })
+
+        assert result["MAX_TOKENS"] == 8000  # int
+        assert result["TEMPERATURE"] == 0.5  # float
+        assert result["THINKING_MODE"] == False  # bool
+        assert result["MAX_MEMORY_MESSAGES"] == 100  # int
+
+    @pytest.mark.parametrize("value,expected", [
+        ("TRUE", True),    # case-insensitive
+        ("yes", False),    # only "true" should be True
+        ("false", False),
+    ])
+    def test_thinking_mode_values(self, value, expected):
+        """Test thinking mode parsing across boolean spellings."""
+        result = _parse_env({"THINKING_MODE": value})
+
+        assert result["THINKING_MODE"] is expected
+
     def test_missing_environment_variables(self):
         """Test behavior with missing environment variables."""
-        # Ensure we're testing with defaults
-        with patch.dict(os.environ, {}, clear=True):
-            from importlib import reload
-            import src.config
-            reload(src.config)
-            
-            # Should use defaults when environment variables are missing
-            assert src.config.Config.MAX_TOKENS == 4000
-            assert src.config.Config.TEMPERATURE == 0.7
-            # THINKING_MODE default may vary, just check it's a bool
-            assert isinstance(src.config.Config.THINKING_MODE, bool)
+        result = _parse_env({})
+
+        # Should use defaults when environment variables are missing
+        assert result["MAX_TOKENS"] == 4000
+        assert result["TEMPERATURE"] == 0.7
+        assert result["THINKING_MODE"] == True
 
 
 class TestConfigValidation:
@@ -300,26 +282,17 @@ class TestConfigValidation:
     
     def test_model_config_thinking_only_for_supported_models(self):
         """Test that thinking mode is only enabled for supported models."""
-        original_model = Config.CLAUDE_MODEL
-        original_thinking = Config.THINKING_MODE
-        
         # Test with supported model
-        Config.CLAUDE_MODEL = "claude-3-7-sonnet-latest"
-        Config.THINKING_MODE = True
-        
-        config = Config.get_model_config()
+        config = _build_model_config(
+            "claude-3-7-sonnet-latest", 4000, 0.7, True, 2000
+        )
         assert "thinking" in config
-        
+
         # Test with unsupported model
-        Config.CLAUDE_MODEL = "claude-3-haiku-20240307"
-        Config.THINKING_MODE = True
-        
-        config = Config.get_model_config()
+        config = _build_model_config(
+            "claude-3-haiku-20240307", 4000, 0.7, True, 2000
+        )
         assert "thinking" not in config  # Should not include thinking for haiku
-        
-        # Restore original values
-        Config.CLAUDE_MODEL = original_model
-        Config.THINKING_MODE = original_thinking
     
     def test_token_limits_validation(self):
         """Test that token limits are reasonable."""
@@ -2,15 +2,19 @@
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from src.llm_handler import LLMHandler, StreamingCallbackHandler
 from src.config import Config
 
+# Input for test_prepare_messages, hoisted so the literal is built once
+_PREPARE_INPUT = (
+    {"role": "user", "content": "Hello"},
+    {"role": "assistant", "content": "Hi there"},
+    {"role": "user", "content": "What about lists?"},
+    {"role": "assistant", "content": "Use square brackets."},
+    {"role": "tool", "content": "ignored"},
+)
+
 
 class TestStreamingCallbackHandler:
     """Test StreamingCallbackHandler class."""
@@ -71,32 +75,53 @@ class TestStreamingCallbackHandler:
 
 class TestLLMHandler:
     """Test LLMHandler class."""
-    
-    @patch('src.llm_handler.ChatAnthropic')
-    def test_initialization(self, mock_chat_anthropic):
-        """Test LLM handler initialization."""
+
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def _patch_anthropic(cls, request):
+        """Patch ChatAnthropic once for the whole class.
+
+        Entering/exiting the patch (and building its MagicMock) per test
+        is the expensive part, so it happens once here; the per-test
+        reset below keeps call records isolated.
+        """
+        with patch('src.llm_handler.ChatAnthropic') as mock_chat:
+            request.cls.mock_chat_anthropic = mock_chat
+            yield
+
+    @pytest.fixture(autouse=True)
+    def _reset_anthropic(self):
+        """Clear call records on the shared mock between tests."""
+        self.mock_chat_anthropic.reset_mock()
+
+    def test_handler_basics(self):
+        """Test initialization, token estimation and system prompt.
+
+        One shared instance covers all three so the constructor (and the
+        patched client construction) only runs once.
+        """
         mock_client = Mock()
-        mock_chat_anthropic.return_value = mock_client
-        
+        self.mock_chat_anthropic.return_value = mock_client
+
         handler = LLMHandler()
-        
+
         assert handler.client == mock_client
         assert handler.current_model == Config.CLAUDE_MODEL
         assert handler.system_prompt is None
-    
-    @patch('src.llm_handler.ChatAnthropic')
-    def test_set_system_prompt(self, mock_chat_anthropic):
-        """Test setting system prompt."""
-        handler = LLMHandler()
-        
+
+        # Token estimation: short text small, longer text larger
+        short_tokens = handler.estimate_tokens("Hello")
+        assert 0 < short_tokens < 10
+        long_text = "This is a much longer text that should have more tokens " * 10
+        assert handler.estimate_tokens(long_text) > short_tokens
+
+        # System prompt set last so earlier checks see the default state
         test_prompt = "You are a helpful assistant."
         handler.set_system_prompt(test_prompt)
-        
         assert handler.system_prompt == test_prompt
     
-    @patch('src.llm_handler.ChatAnthropic')
     @patch('src.config.get_available_models')
-    def test_switch_model(self, mock_get_models, mock_chat_anthropic):
+    def test_switch_model(self, mock_get_models):
         """Test model switching."""
         mock_get_models.return_value = {
             "claude-3-haiku-20240307": "Claude 3 Haiku",
@@ -116,25 +141,8 @@ class TestLLMHandler:
         result = handler.switch_model("invalid-model")
         assert result == False
     
-    @patch('src.llm_handler.ChatAnthropic')
-    def test_estimate_tokens(self, mock_chat_anthropic):
-        """Test token estimation."""
-        handler = LLMHandler()
-        
-        # Test short text
-        short_text = "Hello"
-        tokens = handler.estimate_tokens(short_text)
-        assert tokens > 0
-        assert tokens < 10
-        
-        # Test longer text
-        long_text = "This is a much longer text that should have more tokens " * 10
-        long_tokens = handler.estimate_tokens(long_text)
-        assert long_tokens > tokens
-    
-    @patch('src.llm_handler.ChatAnthropic')
     @patch('src.config.get_available_models')
-    def test_get_model_info(self, mock_get_models, mock_chat_anthropic):
+    def test_get_model_info(self, mock_get_models):
         """Test getting model information."""
         mock_get_models.return_value = {
             "claude-3-7-sonnet-latest": "Claude 3.7 Sonnet"
@@ -151,8 +159,7 @@ class TestLLMHandler:
         assert "temperature" in info
         assert "system_prompt" in info
     
-    @patch('src.llm_handler.ChatAnthropic')
-    def test_supports_thinking_mode(self, mock_chat_anthropic):
+    def test_supports_thinking_mode(self):
         """Test checking thinking mode support."""
         handler = LLMHandler()
         
@@ -164,30 +171,25 @@ class TestLLMHandler:
         handler.current_model = "claude-3-haiku-20240307"
         assert handler.supports_thinking_mode() == False
     
-    @patch('src.llm_handler.ChatAnthropic')
-    def test_prepare_messages(self, mock_chat_anthropic):
+    def test_prepare_messages(self):
         """Test message preparation."""
         handler = LLMHandler()
-        
+
         # Set system prompt
         handler.set_system_prompt("You are helpful.")
-        
-        # Test message conversion
-        messages = [
-            {"role": "user", "content": "Hello"},
-            {"role": "assistant", "content": "Hi there"}
-        ]
-        
-        prepared = handler._prepare_messages(messages)
-        
-        # Should have system message + 2 messages
-        assert len(prepared) == 3
+
+        prepared = handler._prepare_messages(list(_PREPARE_INPUT))
+
+        # Should have system message + the user/assistant messages;
+        # unknown roles are dropped
+        assert len(prepared) == 5
         assert prepared[0].content == "You are helpful."
         assert prepared[1].content == "Hello"
         assert prepared[2].content == "Hi there"
+        assert prepared[3].content == "What about lists?"
+        assert prepared[4].content == "Use square brackets."
     
-    @patch('src.llm_handler.ChatAnthropic')
-    def test_handle_api_error(self, mock_chat_anthropic):
+    def test_handle_api_error(self):
         """Test API error handling."""
         handler = LLMHandler()
         
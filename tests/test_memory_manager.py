@@ -1,17 +1,8 @@
 """Tests for the memory manager."""
 
 import pytest
-import json
-from datetime import datetime, timezone
-from unittest.mock import Mock, patch
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from src.memory_manager import MemoryManager, ConversationSession, MessageData, SessionMetadata
-from src.config import Config
 
 
 class TestMessageData:
@@ -160,6 +151,118 @@ class TestConversationSession:
         assert context[0]["content"] == "Message 2"
         assert context[1]["content"] == "Response 2"
     
+    def test_extend_messages(self):
+        """Test appending a batch of messages in one pass."""
+        session = ConversationSession("test-id")
+
+        session.add_message("user", "Start", tokens=5)
+        session.extend_messages([
+            MessageData(
+                role="user",
+                content="Bulk 1",
+                timestamp="2025-01-01T12:00:00Z",
+                tokens=10,
+            ),
+            MessageData(
+                role="assistant",
+                content="Bulk 2",
+                timestamp="2025-01-01T12:00:01Z",
+                tokens=12,
+            ),
+        ])
+
+        assert len(session.messages) == 3
+        assert session.metadata.message_count == 3
+        assert session.metadata.total_tokens == 27
+        assert session.metadata.last_updated == "2025-01-01T12:00:01Z"
+
+        # Prefix sums must cover the batch too
+        context = session.get_recent_context(token_limit=22)
+        assert [msg["content"] for msg in context] == ["Bulk 1", "Bulk 2"]
+
+    def test_extend_messages_bounded(self):
+        """Test batch append on a bounded session that overflows."""
+        session = ConversationSession("test-id", max_messages=2)
+
+        session.add_message("user", "old", tokens=5)
+        session.extend_messages([
+            MessageData(
+                role="user",
+                content="new 1",
+                timestamp="2025-01-01T12:00:00Z",
+                tokens=10,
+            ),
+            MessageData(
+                role="assistant",
+                content="new 2",
+                timestamp="2025-01-01T12:00:01Z",
+                tokens=12,
+            ),
+        ])
+
+        # "old" was evicted; bookkeeping reflects only the survivors
+        assert [msg.content for msg in session.messages] == ["new 1", "new 2"]
+        assert session.metadata.message_count == 2
+        assert session.metadata.total_tokens == 22
+
+    def test_bounded_session_eviction(self):
+        """Test token accounting when a bounded session overflows."""
+        session = ConversationSession("test-id", max_messages=3)
+
+        for i in range(5):
+            session.add_message("user", f"Message {i}", tokens=10)
+
+        # Only the last three survive and the counters track them
+        contents = [msg.content for msg in session.messages]
+        assert contents == ["Message 2", "Message 3", "Message 4"]
+        assert session.metadata.message_count == 3
+        assert session.metadata.total_tokens == 30
+
+        # Evicted entries are settled out of the prefix-sum column
+        assert len(session._cum_tokens) == 4
+
+    def test_bounded_session_recent_context(self):
+        """Test recent context on a session with a nonzero prefix-sum base."""
+        session = ConversationSession("test-id", max_messages=3)
+
+        for i, tokens in enumerate([20, 25, 15, 10, 5]):
+            session.add_message("user", f"Message {i}", tokens=tokens)
+
+        # Eviction leaves the prefix sums with a nonzero base offset
+        assert session._cum_tokens[0] > 0
+
+        # Budgeting must use differences, not absolute prefix values
+        context = session.get_recent_context(token_limit=16)
+        assert [msg["content"] for msg in context] == ["Message 3", "Message 4"]
+
+    def test_search_index_tracks_mutations(self):
+        """Test that the search index follows message additions and clears."""
+        session = ConversationSession("test-id")
+
+        session.add_message("user", "alpha", tokens=5)
+        assert session.find_matching_messages("alpha") == [0]
+
+        # Messages added after the index was built must still be found
+        session.add_message("assistant", "beta alpha", tokens=5)
+        assert session.find_matching_messages("alpha") == [0, 1]
+
+        session.clear_messages()
+        assert session.find_matching_messages("alpha") == []
+
+    def test_search_after_eviction(self):
+        """Test search correctness after ring-buffer eviction."""
+        session = ConversationSession("test-id", max_messages=2)
+
+        session.add_message("user", "first", tokens=5)
+        assert session.find_matching_messages("first") == [0]
+
+        # Overflow the capacity so "first" is evicted
+        session.add_message("assistant", "second", tokens=5)
+        session.add_message("user", "third", tokens=5)
+
+        assert session.find_matching_messages("first") == []
+        assert session.find_matching_messages("third") == [1]
+
     def test_pin_unpin_messages(self):
         """Test pinning and unpinning messages."""
         session = ConversationSession("test-id")
@@ -348,6 +451,23 @@ class TestMemoryManager:
         assert result["old_count"] == 120
         assert result["new_count"] < 120
     
+    def test_optimize_memory_bounded_session(self):
+        """Test memory optimization on a session that has evicted messages."""
+        manager = MemoryManager()
+
+        manager.create_session("Bounded", max_messages=100)
+
+        # Overflow the capacity so the prefix sums carry a nonzero base
+        for i in range(120):
+            manager.add_message("user", f"Message {i}", tokens=10)
+
+        result = manager.optimize_memory()
+
+        assert result["optimized"] == True
+        assert result["old_count"] == 100
+        # 75 old messages at 10 tokens each, summarized into 75 tokens
+        assert result["tokens_saved"] == 675
+
     def test_search_messages(self):
         """Test searching messages."""
         manager = MemoryManager()
@@ -370,6 +490,29 @@ class TestMemoryManager:
         # Verify the result is from session 2 (either id1 or id2 could be current)
         assert results[0]["content"] == "What is JavaScript?"
     
+    def test_search_whitespace_queries(self):
+        """Test searching with queries the word index cannot serve."""
+        manager = MemoryManager()
+
+        manager.create_session("Session 1")
+        manager.add_message("user", "line one\nline two", tokens=10)
+        manager.add_message("assistant", "tab\there", tokens=8)
+        manager.add_message("user", "pure Python code", tokens=10)
+
+        # Queries spanning a newline or tab fall back to a linear scan
+        results = manager.search_messages("one\nline")
+        assert len(results) == 1
+        assert results[0]["content"] == "line one\nline two"
+
+        results = manager.search_messages("tab\there")
+        assert len(results) == 1
+        assert results[0]["content"] == "tab\there"
+
+        # Multi-word queries go through the same fallback
+        results = manager.search_messages("Python code")
+        assert len(results) == 1
+        assert results[0]["content"] == "pure Python code"
+
     def test_get_memory_stats(self):
         """Test getting memory statistics."""
         manager = MemoryManager()